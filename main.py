@@ -1,41 +1,177 @@
 import argparse
+import concurrent.futures
+import contextlib
+import functools
+import glob
+import hashlib
 import logging
 import os
-import subprocess
+import pathlib
+import re
 import sys
+import types
 import json
+import marshal
+import mmap
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml-backed, much faster than the pure-Python loader
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Identifies the JSON parser in cache keys, so cached data is never reused across backends
+JSON_BACKEND = "orjson" if orjson else "json"
+
+# 19+ digit numbers may not fit in 64 bits; orjson turns those into floats where json keeps ints
+_LONG_DIGITS = re.compile(rb"\d{19}")
+
+
+def _json_loads(data):
+    """
+    Parses JSON with orjson when it is installed, giving the same result as json.loads.
+
+    Input orjson would parse differently (integers wider than 64 bits) or
+    reject where json.loads does not (NaN, Infinity, lone surrogates) is
+    handed to json.loads instead.
+
+    Args:
+        data (bytes, memoryview or mmap.mmap): The JSON document.
+
+    Returns:
+        The parsed JSON value.
+    """
+    if orjson is not None and _LONG_DIGITS.search(data) is None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # Let json.loads accept it or raise its own error
+    return json.loads(bytes(data))  # json.loads does not accept memoryviews
+
+try:
+    from yamllint import linter as yamllint_linter
+    from yamllint.config import YamlLintConfig
+except ImportError:  # YAML linting is unavailable without yamllint
+    yamllint_linter = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Bump whenever the layout of the cached rules changes so stale sidecars are ignored
+RULES_CACHE_VERSION = 6
+
+# Bump whenever analysis output changes so stale cached results are ignored
+RESULT_CACHE_VERSION = 2
+
+# Where analysis results are cached, keyed by a hash of the rules and config file contents
+RESULT_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "confighardening")
+
+@contextlib.contextmanager
+def _map_file(file_path):
+    """
+    Memory-maps a file read-only so its pages are only loaded as the parser touches them.
+
+    Args:
+        file_path (str): The path to the file.
+
+    Yields:
+        mmap.mmap: The mapped file, or b"" for an empty file (which cannot be mapped).
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
 class ConfigHardeningSuggester:
     """
     Analyzes configuration files and suggests security hardening measures.
     """
 
-    def __init__(self):
+    def __init__(self, rules_file="rules.json", use_cache=True, enable_lint=False):
         """
         Initializes the ConfigHardeningSuggester.
+
+        Args:
+            rules_file (str): The path to the JSON rules file.
+            use_cache (bool): Whether to read/write the parsed rules sidecar cache
+                and the analysis result cache.
+            enable_lint (bool): Whether to also run yamllint on YAML files. Parsing
+                already rejects syntax errors; the linter only adds style checks.
         """
-        self.rules = self._load_rules()  # Load hardening rules from a file
         self.logger = logging.getLogger(__name__)
+        self.use_cache = use_cache
+        if enable_lint and yamllint_linter is None:  # Fail before any file is analyzed
+            self.logger.error("Linter not found: yamllint is not installed")
+            print("Error: Linter not found. Please ensure yamllint is installed.")
+            sys.exit(1)
+        self.enable_lint = enable_lint
+        self._yaml_conf = YamlLintConfig("extends: default") if enable_lint else None  # Reused for every YAML file
+        rules_digest, self.rules = self._load_rules(rules_file)  # Load hardening rules from a file
+        self._rules_digest = rules_digest  # Set after the setter, which clears it
+
+    @property
+    def rules(self):
+        """
+        Mapping: A read-only view of the hardening rules. Rules are compiled
+        when assigned, so only assigning new rules takes effect; the view
+        cannot be edited in place. Assigning copies the rules, prepares them
+        if needed and rebuilds the rule trie.
+        """
+        return types.MappingProxyType({rule_name: types.MappingProxyType(rule_details) for rule_name, rule_details in self._rules.items()})
+
+    @rules.setter
+    def rules(self, rules):
+        # Own copy, so neither the caller's dict nor the rules shared by _load_rules_cached can change under us
+        rules = {rule_name: dict(rule_details) for rule_name, rule_details in rules.items()}
+        if any(rule_details.get("type") == "key_check" and "_key_tuple" not in rule_details for rule_details in rules.values()):
+            self._prepare_rules(rules)  # Raw parsed rules
+        self._rules = rules
+        self._rules_digest = None  # Unknown rules source; the result cache is skipped until a rules file is loaded
+        self._compiled_rules = self._compile_rules(rules)
+        self._rule_trie = self._build_rule_trie(self._compiled_rules)
+
+    def __getstate__(self):
+        """
+        Drops the compiled rule checks, which are closures and cannot be pickled.
+        """
+        state = self.__dict__.copy()
+        del state["_compiled_rules"]
+        del state["_rule_trie"]
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores a pickled suggester (e.g. in a worker process) and recompiles its rules.
+        """
+        self.__dict__.update(state)
+        self.rules = state["_rules"]
+        self._rules_digest = state["_rules_digest"]
 
     def _load_rules(self, rules_file="rules.json"):
         """
         Loads hardening rules from a JSON file.
 
+        The returned rules may be shared with other suggesters that loaded
+        the same file and must not be modified.
+
         Args:
             rules_file (str): The path to the JSON rules file.
 
         Returns:
-            dict: A dictionary containing the hardening rules.
+            tuple: A hash of the rules file contents, which keys the analysis
+                result cache, and a dictionary containing the hardening rules.
         """
         try:
-            with open(rules_file, "r") as f:
-                rules = json.load(f)
-            self.logger.info(f"Loaded rules from {rules_file}")
-            return rules
+            stat = os.stat(rules_file)
+            # Parsed at most once per process while the file is unchanged
+            return _load_rules_cached(os.path.abspath(rules_file), stat.st_mtime_ns, stat.st_size, self.use_cache)
         except FileNotFoundError:
             self.logger.error(f"Rules file not found: {rules_file}")
             print(f"Error: Rules file not found: {rules_file}")
@@ -49,41 +185,272 @@ class ConfigHardeningSuggester:
             print(f"Error loading rules: {e}")
             sys.exit(1)
 
-    def _run_linter(self, file_path, linter_type):
+    @staticmethod
+    def _prepare_rules(rules):
         """
-        Runs yamllint or jsonlint on the file.
+        Precomputes per-rule data so analysis does not redo it for every config.
+
+        Adds "_key_tuple" (the pre-split key path) and "_is_list" (whether
+        value_check accepts multiple values) to each key_check rule in place,
+        turns list value_checks into frozensets for O(1) membership tests
+        when all of their values are hashable, and interns the suggestion text.
 
         Args:
-            file_path (str): The path to the configuration file.
-            linter_type (str): The type of linter to run ("yaml" or "json").
+            rules (dict): The parsed hardening rules.
+        """
+        for rule_details in rules.values():
+            if rule_details.get("type") != "key_check":
+                continue
+            rule_details["_key_tuple"] = tuple(rule_details["key_path"].split("."))  # Assumes dot notation for nested keys
+            rule_details["_is_list"] = isinstance(rule_details.get("value_check"), list)
+            rule_details["suggestion"] = sys.intern(rule_details["suggestion"])  # marshal keeps it interned in the sidecar
+            if rule_details["_is_list"]:
+                try:
+                    rule_details["value_check"] = frozenset(rule_details["value_check"])
+                except TypeError:
+                    pass  # Unhashable values (nested lists/objects); keep the list
+
+    @classmethod
+    def _compile_rules(cls, rules):
+        """
+        Compiles the key_check rules into specialized check functions.
+
+        Which check applies, the expected value and the suggestion text are
+        all resolved here once, so analysis only calls the checks.
+
+        Args:
+            rules (dict): The prepared hardening rules.
+
+        Returns:
+            list: (key_tuple, check) pairs in rule file order, where check takes
+                the config value at the key path (None if missing) and returns
+                the suggestion text or None.
+        """
+        compiled_rules = []
+        for rule_details in rules.values():
+            if rule_details.get("type") != "key_check":
+                continue
+            key_path = rule_details["key_path"]
+            suggestion = rule_details["suggestion"]
+            if "value_check" not in rule_details:
+                check = cls._make_key_missing_check(key_path, suggestion)
+            elif rule_details["_is_list"]:  # multiple values accepted
+                check = cls._make_value_in_set_check(key_path, rule_details["value_check"], suggestion)
+            else:
+                check = cls._make_value_equals_check(key_path, rule_details["value_check"], suggestion)
+            compiled_rules.append((rule_details["_key_tuple"], check))
+        return compiled_rules
+
+    @staticmethod
+    def _make_key_missing_check(key_path, suggestion):
+        """
+        Builds a check that only requires the key to be present.
+        """
+        missing_text = sys.intern(f"Missing key: {key_path}. Suggestion: {suggestion}")
+
+        def check(current_data):
+            return missing_text if current_data is None else None
+        return check
+
+    @staticmethod
+    def _make_value_equals_check(key_path, expected_value, suggestion):
+        """
+        Builds a check that requires the key to be present and equal to expected_value.
+        """
+        missing_text = sys.intern(f"Missing key: {key_path}. Suggestion: {suggestion}")
+
+        def check(current_data):
+            if current_data is None:  # Key doesn't exist; Suggest adding it
+                return missing_text
+            if current_data != expected_value:
+                return sys.intern(f"Value for key: {key_path} is: {current_data}. Suggestion: {suggestion}")  # Shared across files reporting the same value
+            return None
+        return check
+
+    @staticmethod
+    def _make_value_in_set_check(key_path, expected_values, suggestion):
+        """
+        Builds a check that requires the key to be present and one of expected_values.
+        """
+        missing_text = sys.intern(f"Missing key: {key_path}. Suggestion: {suggestion}")
+
+        def check(current_data):
+            if current_data is None:  # Key doesn't exist; Suggest adding it
+                return missing_text
+            try:
+                if current_data in expected_values:
+                    return None
+            except TypeError:
+                pass  # Unhashable config value can't be in a set of scalars
+            return sys.intern(f"Value for key: {key_path} is: {current_data}. Suggestion: {suggestion}")
+        return check
+
+    @staticmethod
+    def _build_rule_trie(compiled_rules):
+        """
+        Builds a trie of the rule key paths keyed by dotted key path segments.
+
+        Rules sharing a key prefix share trie nodes, so the config subtree for
+        that prefix is only looked up once per analysis.
+
+        Args:
+            compiled_rules (list): (key_tuple, check) pairs from _compile_rules.
+
+        Returns:
+            dict: Nested {segment: child_trie}.
+        """
+        trie = {}
+        for key_tuple, _ in compiled_rules:
+            children = trie
+            for key in key_tuple:
+                children = children.setdefault(key, {})
+        return trie
+
+    @classmethod
+    def _flatten(cls, config_node, trie_node, prefix=(), flat=None):
+        """
+        Flattens the parts of the config that the rules look at into one mapping.
+
+        Only branches present in the rule trie are visited, so the cost is
+        bounded by the rule key paths rather than the size of the config.
+        Keys are key path tuples, so a literal "a.b" key in the config is
+        not confused with the nested path a -> b.
+
+        Args:
+            config_node: The config subtree matching trie_node.
+            trie_node (dict): The rule trie node to descend.
+            prefix (tuple): The key path of config_node.
+            flat (dict): The mapping being filled in.
+
+        Returns:
+            dict: Maps key path tuples to config values; missing or null keys are absent.
+        """
+        if flat is None:
+            flat = {}
+        if not isinstance(config_node, dict):  # Nothing below a scalar or list can match
+            return flat
+        for segment, child_trie in trie_node.items():
+            current_data = config_node.get(segment)
+            if current_data is None:  # A null value is reported as a missing key
+                continue
+            key_tuple = prefix + (segment,)
+            flat[key_tuple] = current_data
+            if child_trie:
+                cls._flatten(current_data, child_trie, key_tuple, flat)
+        return flat
+
+    def _result_cache_path(self, data, parser_kind):
+        """
+        Returns the result cache file for a config file's contents under the current rules.
+
+        The key covers how the contents are parsed as well, since the same
+        bytes can mean different things as YAML and as JSON.
+
+        Args:
+            data (bytes or mmap.mmap): The contents of the config file.
+            parser_kind (str): The parser used for the file ("yaml" or "json").
+
+        Returns:
+            str: The cache file path, or None if result caching is disabled or
+                the rules were assigned directly rather than loaded from a file.
+        """
+        if not self.use_cache or self._rules_digest is None:
+            return None
+        parser_backend = SafeLoader.__name__ if parser_kind == "yaml" else JSON_BACKEND
+        prefix = f"{RESULT_CACHE_VERSION}\0{parser_kind}\0{parser_backend}\0".encode()
+        key = hashlib.blake2b(prefix + self._rules_digest + b"\0", digest_size=16)
+        key.update(data)  # Hashes the mapped buffer directly instead of concatenating (and copying) it
+        return os.path.join(RESULT_CACHE_DIR, f"{key.hexdigest()}.json")
+
+    def _read_result_cache(self, cache_path):
+        """
+        Reads cached suggestions for a config file.
+
+        Args:
+            cache_path (str): The result cache file, or None if caching is disabled.
+
+        Returns:
+            list: The cached suggestions, or None on a cache miss.
+        """
+        if cache_path is None:
+            return None
+        try:
+            return _json_loads(pathlib.Path(cache_path).read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable result cache {cache_path}: {e}")
+            return None
+
+    def _write_result_cache(self, cache_path, suggestions):
+        """
+        Writes suggestions for a config file to the result cache.
+
+        Args:
+            cache_path (str): The result cache file, or None if caching is disabled.
+            suggestions (list): The hardening suggestions.
+        """
+        if cache_path is None:
+            return
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(RESULT_CACHE_DIR, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(suggestions, f)
+            os.replace(tmp_path, cache_path)  # Atomic, so readers never see a partial result
+        except Exception as e:
+            self.logger.warning(f"Could not write result cache {cache_path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _run_linter(self, file_path, data):
+        """
+        Runs yamllint in-process on the already read file contents.
+
+        JSON files are not linted separately: json.load already rejects
+        syntax errors while the file is parsed.
+
+        Args:
+            file_path (str): The path to the YAML configuration file.
+            data (bytes or mmap.mmap): The contents of the file.
 
         Returns:
             tuple: A tuple containing the return code and the output of the linter.
         """
         try:
-            if linter_type == "yaml":
-                command = ["yamllint", file_path]
-            elif linter_type == "json":
-                command = ["jsonlint", file_path]
-            else:
-                self.logger.error(f"Unsupported linter type: {linter_type}")
-                return 1, f"Unsupported linter type: {linter_type}"
+            problems = list(yamllint_linter.run(data[:], self._yaml_conf, file_path))  # yamllint needs real bytes
 
-            result = subprocess.run(command, capture_output=True, text=True, check=False) #check=False prevents raising exception if linter fails
+            output = "\n".join(f"{file_path}:{p.line}:{p.column}: [{p.level}] {p.message}" for p in problems)
+            returncode = 1 if any(p.level == "error" for p in problems) else 0  # Same exit status as the yamllint CLI
 
-            if result.returncode != 0:
-                self.logger.warning(f"{linter_type.capitalize()}lint found issues in {file_path}:\n{result.stderr}")
+            if returncode != 0:
+                self.logger.warning(f"Yamllint found issues in {file_path}:\n{output}")
 
-            return result.returncode, result.stdout + result.stderr
+            return returncode, output
 
-        except FileNotFoundError as e:
-            self.logger.error(f"Linter not found: {e}")
-            print(f"Error: Linter not found. Please ensure yamllint or jsonlint is installed.")
-            sys.exit(1)
         except Exception as e:
             self.logger.error(f"Error running linter: {e}")
             return 1, f"Error running linter: {e}"
 
+    def analyze_configs(self, file_paths, jobs=1):
+        """
+        Analyzes several configuration files.
+
+        Args:
+            file_paths (list): The paths to the configuration files.
+            jobs (int): The number of worker processes to analyze files with.
+
+        Returns:
+            dict: Maps each file path to its list of hardening suggestions.
+        """
+        if jobs > 1 and len(file_paths) > 1:
+            # The suggester (with its parsed rules) is sent to each worker once, not per file
+            with concurrent.futures.ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(self,)) as executor:
+                return dict(zip(file_paths, executor.map(_analyze_in_worker, file_paths)))
+
+        return {file_path: self.analyze_config(file_path) for file_path in file_paths}
 
     def analyze_config(self, file_path):
         """
@@ -95,88 +462,203 @@ class ConfigHardeningSuggester:
         Returns:
             list: A list of hardening suggestions.
         """
+        return list(self.iter_suggestions(file_path))
+
+    def iter_suggestions(self, file_path):
+        """
+        Analyzes a configuration file and yields hardening suggestions as they are found.
+
+        Args:
+            file_path (str): The path to the configuration file.
+
+        Yields:
+            str: A hardening suggestion.
+        """
         try:
             # Determine file type and load the content
             file_extension = os.path.splitext(file_path)[1].lower()
 
             if file_extension in [".yaml", ".yml"]:
                 try:
-                    with open(file_path, "r") as f:
-                        config_data = yaml.safe_load(f)
-                    self._run_linter(file_path, "yaml")  # Run yamllint
+                    with _map_file(file_path) as data:  # Mapped once for hashing, parsing and linting
+                        result_cache_path = self._result_cache_path(data, "yaml")
+                        cached_suggestions = self._read_result_cache(result_cache_path)
+                        if cached_suggestions is None:
+                            config_data = yaml.load(data, Loader=SafeLoader)  # Reads the map as a stream
+                        if self.enable_lint:
+                            self._run_linter(file_path, data)  # Run yamllint
                 except yaml.YAMLError as e:
                     self.logger.error(f"Error parsing YAML file {file_path}: {e}")
                     print(f"Error: Invalid YAML file: {file_path}")
-                    return ["YAML Parse Error: Please check the file for syntax errors."]
+                    yield "YAML Parse Error: Please check the file for syntax errors."
+                    return
                 except Exception as e:
                     self.logger.error(f"Error loading YAML file {file_path}: {e}")
                     print(f"Error: Error loading YAML file: {file_path}")
-                    return ["Error loading file. Please check permissions and format."]
+                    yield "Error loading file. Please check permissions and format."
+                    return
 
             elif file_extension == ".json":
                 try:
-                    with open(file_path, "r") as f:
-                        config_data = json.load(f)
-                    self._run_linter(file_path, "json") # Run jsonlint
+                    with _map_file(file_path) as data:
+                        result_cache_path = self._result_cache_path(data, "json")
+                        cached_suggestions = self._read_result_cache(result_cache_path)
+                        if cached_suggestions is None:
+                            with memoryview(data) as view:  # Released before the map is closed
+                                config_data = _json_loads(view)
                 except json.JSONDecodeError as e:
                     self.logger.error(f"Error parsing JSON file {file_path}: {e}")
                     print(f"Error: Invalid JSON file: {file_path}")
-                    return ["JSON Parse Error: Please check the file for syntax errors."]
+                    yield "JSON Parse Error: Please check the file for syntax errors."
+                    return
                 except Exception as e:
                     self.logger.error(f"Error loading JSON file {file_path}: {e}")
                     print(f"Error: Error loading JSON file: {file_path}")
-                    return ["Error loading file. Please check permissions and format."]
+                    yield "Error loading file. Please check permissions and format."
+                    return
             else:
                 self.logger.warning(f"Unsupported file type: {file_extension}")
                 print(f"Warning: Unsupported file type: {file_extension}")
-                return [f"Unsupported file type: {file_extension}"]
-
-            # Apply hardening rules based on the loaded data
-            suggestions = []
-            for rule_name, rule_details in self.rules.items():
-                if rule_details["type"] == "key_check":
-                    key_path = rule_details["key_path"]
-                    current_data = config_data
-                    try:
-                        for key in key_path.split("."):  # Assumes dot notation for nested keys
-                            if key in current_data:
-                                current_data = current_data[key]
-                            else:
-                                current_data = None # Key not found
-                                break # exit loop for checking nested keys
-                    except:
-                        current_data = None # Error occured while accessing the config_data
-
-                    if current_data is None: # Key doesn't exist; Suggest adding it
-
-                        suggestion_text = f"Missing key: {key_path}. Suggestion: {rule_details['suggestion']}"
-                        suggestions.append(suggestion_text)
+                yield f"Unsupported file type: {file_extension}"
+                return
+
+            info_enabled = self.logger.isEnabledFor(logging.INFO)  # Skip logging dispatch per suggestion when filtered
+
+            if cached_suggestions is not None:  # Same rules and config contents as a previous run
+                for suggestion_text in cached_suggestions:
+                    if info_enabled:
                         self.logger.info(suggestion_text)
+                    yield suggestion_text
+                return
+
+            # Apply hardening rules based on the loaded data: one walk, then a dict lookup per rule
+            flat = self._flatten(config_data, self._rule_trie)
+            suggestions = []  # Only kept for the result cache
+            for key_tuple, check in self._compiled_rules:  # Rule file order
+                suggestion_text = check(flat.get(key_tuple))
+                if suggestion_text:
+                    if info_enabled:
+                        self.logger.info(suggestion_text)
+                    if result_cache_path is not None:
+                        suggestions.append(suggestion_text)
+                    yield suggestion_text
 
-                    else: # Key exists. Check its value
+            self._write_result_cache(result_cache_path, suggestions)
 
-                        if "value_check" in rule_details:
-                            expected_value = rule_details["value_check"]
+        except Exception as e:
+            self.logger.error(f"Error analyzing config file {file_path}: {e}")
+            print(f"Error analyzing config file: {e}")
+            yield "An unexpected error occurred during analysis."
 
-                            if isinstance(expected_value, list): # multiple values accepted
-                                if current_data not in expected_value:
-                                    suggestion_text = f"Value for key: {key_path} is: {current_data}. Suggestion: {rule_details['suggestion']}"
-                                    suggestions.append(suggestion_text)
-                                    self.logger.info(suggestion_text)
-                            else:
-                                if current_data != expected_value:
-                                    suggestion_text = f"Value for key: {key_path} is: {current_data}. Suggestion: {rule_details['suggestion']}"
-                                    suggestions.append(suggestion_text)
-                                    self.logger.info(suggestion_text)
 
+@functools.lru_cache(maxsize=8)
+def _load_rules_cached(rules_file, mtime_ns, size, use_cache):
+    """
+    Loads and prepares a rules file, memoized on its path, mtime and size.
 
+    Args:
+        rules_file (str): The absolute path to the JSON rules file.
+        mtime_ns (int): The modification time of the rules file.
+        size (int): The size of the rules file.
+        use_cache (bool): Whether to read/write the parsed rules sidecar cache.
 
-            return suggestions
+    Returns:
+        tuple: The rules file hash and the prepared rules.
+    """
+    logger = logging.getLogger(__name__)
+    cache_path = rules_file + ".cache"
+    if use_cache:
+        cached = _read_rules_cache(cache_path, mtime_ns, size)
+        if cached is not None:
+            logger.info(f"Loaded rules from cache {cache_path}")
+            return cached
+
+    data = pathlib.Path(rules_file).read_bytes()
+    rules = _json_loads(data)
+    ConfigHardeningSuggester._prepare_rules(rules)
+    cached = (hashlib.blake2b(data, digest_size=16).digest(), rules)
+    logger.info(f"Loaded rules from {rules_file}")
+
+    if use_cache:
+        _write_rules_cache(cache_path, mtime_ns, size, cached)
+    return cached
+
+
+def _read_rules_cache(cache_path, mtime_ns, size):
+    """
+    Reads parsed rules from the marshal sidecar if it matches the rules file.
 
-        except Exception as e:
-            self.logger.error(f"Error analyzing config file {file_path}: {e}")
-            print(f"Error analyzing config file: {e}")
-            return ["An unexpected error occurred during analysis."]
+    Args:
+        cache_path (str): The path to the sidecar cache file.
+        mtime_ns (int): The modification time of the rules file.
+        size (int): The size of the rules file.
+
+    Returns:
+        tuple: The rules file hash and the cached rules, or None if the cache is missing or stale.
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            header = marshal.load(f)
+            if header != (RULES_CACHE_VERSION, JSON_BACKEND, mtime_ns, size):
+                return None
+            return marshal.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Ignoring unreadable rules cache {cache_path}: {e}")
+        return None
+
+
+def _write_rules_cache(cache_path, mtime_ns, size, cached):
+    """
+    Writes parsed rules to the marshal sidecar, keyed by the rules file mtime and size.
+
+    Args:
+        cache_path (str): The path to the sidecar cache file.
+        mtime_ns (int): The modification time of the rules file.
+        size (int): The size of the rules file.
+        cached (tuple): The rules file hash and the parsed rules.
+    """
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            marshal.dump((RULES_CACHE_VERSION, JSON_BACKEND, mtime_ns, size), f)
+            marshal.dump(cached, f)
+        os.replace(tmp_path, cache_path)  # Atomic, so readers never see a partial cache
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Could not write rules cache {cache_path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+# Suggester used by analyze_configs worker processes, set once per worker by _init_worker
+_worker_suggester = None
+
+
+def _init_worker(suggester):
+    """
+    Stores the suggester in the worker process so each task can reuse it.
+
+    Args:
+        suggester (ConfigHardeningSuggester): The suggester with its rules loaded.
+    """
+    global _worker_suggester
+    _worker_suggester = suggester
+
+
+def _analyze_in_worker(file_path):
+    """
+    Analyzes a configuration file in a worker process.
+
+    Args:
+        file_path (str): The path to the configuration file.
+
+    Returns:
+        list: A list of hardening suggestions.
+    """
+    return _worker_suggester.analyze_config(file_path)
 
 
 def setup_argparse():
@@ -187,8 +669,11 @@ def setup_argparse():
         argparse.ArgumentParser: The argument parser.
     """
     parser = argparse.ArgumentParser(description="Analyzes configuration files and suggests security hardening measures.")
-    parser.add_argument("config_file", help="Path to the configuration file to analyze.")
+    parser.add_argument("config_files", nargs="+", metavar="config_file", help="Path(s) or glob pattern(s) of the configuration files to analyze.")
     parser.add_argument("--rules", help="Path to the hardening rules JSON file. Defaults to rules.json", default="rules.json") # Added argument for rules file
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the parsed rules cache (rules.json.cache) or the analysis result cache.")
+    parser.add_argument("--lint", action="store_true", help="Also run yamllint on YAML files and log any issues it finds.")
+    parser.add_argument("--jobs", type=int, default=1, help="Number of worker processes used to analyze multiple config files. 0 uses all CPUs. Defaults to 1")
     return parser
 
 
@@ -198,26 +683,46 @@ def main():
     """
     parser = setup_argparse()
     args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 or greater")
+    jobs = args.jobs or os.cpu_count() or 1
+
+    # Expand glob patterns the shell left alone (e.g. quoted or on Windows)
+    config_files = []
+    for pattern in args.config_files:
+        if os.path.exists(pattern):  # A literal path, even if it contains glob characters
+            config_files.append(pattern)
+            continue
+        matches = [path for path in sorted(glob.glob(pattern)) if os.path.isfile(path)]  # Skip directories
+        config_files.extend(matches or [pattern])
+    config_files = list(dict.fromkeys(config_files))  # Analyze each file once
 
     # Input validation
-    if not os.path.isfile(args.config_file):
-        print(f"Error: Config file not found: {args.config_file}")
-        logging.error(f"Config file not found: {args.config_file}")
-        sys.exit(1)
+    for config_file in config_files:
+        if not os.path.isfile(config_file):
+            print(f"Error: Config file not found: {config_file}")
+            logging.error(f"Config file not found: {config_file}")
+            sys.exit(1)
 
     # Initialize ConfigHardeningSuggester with rules file from CLI
-    suggester = ConfigHardeningSuggester()
-    suggester.rules = suggester._load_rules(args.rules)
-
+    suggester = ConfigHardeningSuggester(args.rules, use_cache=not args.no_cache, enable_lint=args.lint)
 
-    suggestions = suggester.analyze_config(args.config_file)
+    if jobs > 1 and len(config_files) > 1:
+        results = suggester.analyze_configs(config_files, jobs=jobs).items()
+    else:  # Stream each suggestion as soon as it is found
+        results = ((config_file, suggester.iter_suggestions(config_file)) for config_file in config_files)
 
-    if suggestions:
-        print("Security Hardening Suggestions:")
+    for config_file, suggestions in results:
+        # Only name the file when there is more than one to tell apart
+        target = f" for {config_file}" if len(config_files) > 1 else ""
+        found = False
         for suggestion in suggestions:
+            if not found:
+                print(f"Security Hardening Suggestions{target}:")
+                found = True
             print(f"- {suggestion}")
-    else:
-        print("No security hardening suggestions found.")
+        if not found:
+            print(f"No security hardening suggestions found{target}.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,96 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import main
+
+
+class ResultCacheTest(unittest.TestCase):
+    """
+    Checks that cached analysis results are only reused for the same parse.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        patcher = mock.patch.object(main, "RESULT_CACHE_DIR", os.path.join(self.tmp_dir.name, "results"))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        rules = {
+            "port": {
+                "type": "key_check",
+                "key_path": "security.port",
+                "value_check": 1000,
+                "suggestion": "Use port 1000.",
+            }
+        }
+        self.rules_file = self._write("rules.json", json.dumps(rules).encode())
+
+    def _write(self, name, data):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def _analyze(self, file_path, use_cache=True):
+        return main.ConfigHardeningSuggester(self.rules_file, use_cache=use_cache).analyze_config(file_path)
+
+    def test_cached_result_is_reused(self):
+        config_file = self._write("a.yaml", b"security:\n  port: 22\n")
+        first = self._analyze(config_file)
+        self.assertEqual(len(os.listdir(main.RESULT_CACHE_DIR)), 1)
+        self.assertEqual(self._analyze(config_file), first)
+
+    def test_empty_file_cached_as_yaml_is_still_invalid_json(self):
+        yaml_file = self._write("e.yaml", b"")
+        json_file = self._write("e.json", b"")
+        self.assertEqual(self._analyze(yaml_file), ["Missing key: security.port. Suggestion: Use port 1000."])
+        self.assertEqual(self._analyze(json_file), ["JSON Parse Error: Please check the file for syntax errors."])
+
+    def test_same_bytes_parsed_differently_as_json_and_yaml(self):
+        data = b'{"security": {"port": 1e3}}'  # JSON reads 1000.0, YAML the string "1e3"
+        json_file = self._write("a.json", data)
+        yaml_file = self._write("a.yaml", data)
+        self.assertEqual(self._analyze(json_file), [])
+        expected = self._analyze(yaml_file, use_cache=False)
+        self.assertEqual(expected, ["Value for key: security.port is: 1e3. Suggestion: Use port 1000."])
+        self.assertEqual(self._analyze(yaml_file), expected)
+
+
+class RulesTest(unittest.TestCase):
+    """
+    Checks that rules can only be changed by assigning them.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        rules = {"fw": {"type": "key_check", "key_path": "security.firewall_enabled", "suggestion": "Enable firewall."}}
+        self.rules_file = os.path.join(self.tmp_dir.name, "rules.json")
+        with open(self.rules_file, "w") as f:
+            json.dump(rules, f)
+
+    def test_rules_view_is_read_only(self):
+        suggester = main.ConfigHardeningSuggester(self.rules_file, use_cache=False)
+        with self.assertRaises(TypeError):
+            suggester.rules["other"] = {"type": "key_check", "key_path": "other", "suggestion": "Add other."}
+        with self.assertRaises(TypeError):
+            suggester.rules["fw"]["suggestion"] = "Changed."
+        self.assertEqual(main.ConfigHardeningSuggester(self.rules_file, use_cache=False).rules["fw"]["suggestion"], "Enable firewall.")
+
+    def test_assigned_rules_take_effect(self):
+        suggester = main.ConfigHardeningSuggester(self.rules_file, use_cache=False)
+        suggester.rules = {**suggester.rules, "other": {"type": "key_check", "key_path": "other", "suggestion": "Add other."}}
+        self.assertEqual(list(suggester.rules), ["fw", "other"])
+        config_file = os.path.join(self.tmp_dir.name, "a.json")
+        with open(config_file, "w") as f:
+            f.write("{}")
+        self.assertEqual(suggester.analyze_config(config_file)[1], "Missing key: other. Suggestion: Add other.")
+        self.assertNotIn("other", main.ConfigHardeningSuggester(self.rules_file, use_cache=False).rules)
+
+
+if __name__ == "__main__":
+    unittest.main()